@@ -1,4 +1,5 @@
 import os, yaml, inspect, airflow
+from functools import lru_cache
 from airflow import DAG
 from gusty.errors import NonexistentDagDirError
 from gusty.parsing import parse, default_parsers
@@ -20,6 +21,47 @@ else:
     from airflow.sensors.external_task_sensor import ExternalTaskSensor
 
 
+############
+## Params ##
+############
+
+# create_dag kwargs that are not DAG defaults
+_NON_DAG_KWARGS = frozenset({"task_group_defaults", "wait_for_defaults"})
+
+# ExternalTaskSensor kwargs that users can set via wait_for_defaults
+_WAIT_FOR_KEYS = frozenset(
+    {
+        "poke_interval",
+        "timeout",
+        "retries",
+        "mode",
+        "soft_fail",
+        "execution_date_fn",
+        "check_existence",
+    }
+)
+
+# Level metadata that is pulled out as dependencies rather than structure kwargs
+_DEP_KEYS = frozenset({"dependencies", "external_dependencies"})
+_EXT_DEP_KEYS = frozenset({"external_dependencies"})
+
+# TaskGroup kwargs that gusty always sets itself
+_TASK_GROUP_RESERVED = frozenset({"dag", "parent_group"})
+
+# build_structure kwargs, which every level of a schematic has
+_BUILD_STRUCTURE_PARAMS = ("parent_id", "name", "metadata")
+
+
+# inspect.signature is slow, so these are read once at import
+_BASE_OPERATOR_PARAMS = frozenset(
+    inspect.signature(airflow.models.BaseOperator.__init__).parameters
+)
+_DAG_PARAMS = frozenset(inspect.signature(DAG.__init__).parameters)
+
+if airflow_version > 1:
+    _TASK_GROUP_PARAMS = frozenset(inspect.signature(TaskGroup.__init__).parameters)
+
+
 #########################
 ## Schematic Functions ##
 #########################
@@ -29,37 +71,43 @@ def create_schematic(dag_dir, parsers=default_parsers):
     """
     Given a dag directory, identify requirements (e.g spec_paths, metadata) for each "level" of the DAG.
     """
-    return {
+    # str.endswith and str.startswith accept tuples, so we only build these once
+    parser_exts = tuple(parsers.keys())
+    skip_prefixes = ("_", ".")
+    root_parent = os.path.basename(os.path.dirname(dag_dir))
+
+    schematic = {}
+    for dir, subdirs, files in os.walk(dag_dir):
+        name = os.path.basename(dir)
+        if name.startswith(skip_prefixes):
+            continue
+
+        abs_dir = os.path.abspath(dir)
+        is_root = os.path.basename(os.path.dirname(dir)) == root_parent
+
         # Each entry is a "level" of the main DAG
-        os.path.abspath(dir): {
-            "name": os.path.basename(dir),
-            "parent_id": os.path.abspath(os.path.dirname(dir))
-            if os.path.basename(os.path.dirname(dir))
-            != os.path.basename(os.path.dirname(dag_dir))
-            else None,
+        schematic[abs_dir] = {
+            "name": name,
+            "parent_id": None if is_root else os.path.abspath(os.path.dirname(dir)),
             "structure": None,
             "spec_paths": [
-                os.path.abspath(os.path.join(dir, file))
+                os.path.join(abs_dir, file)
                 for file in files
-                if file.endswith((".xyz", ".nonexistent"))
+                if file.endswith(parser_exts)
                 and file != "METADATA.yml"
-                and not file.startswith(("_", "."))
+                and not file.startswith(skip_prefixes)
             ],
             "specs": [],
-            "metadata_path": os.path.abspath(os.path.join(dir, "METADATA.yml"))
+            "metadata_path": os.path.join(abs_dir, "METADATA.yml")
             if "METADATA.yml" in files
             else None,
             "metadata": {},
             "tasks": {},
-            "dependencies": []
-            if os.path.basename(os.path.dirname(dir))
-            != os.path.basename(os.path.dirname(dag_dir))
-            else None,
+            "dependencies": None if is_root else [],
             "external_dependencies": [],
         }
-        for dir, subdirs, files in os.walk(dag_dir)
-        if not os.path.basename(dir).startswith(("_", "."))
-    }
+
+    return schematic
 
 
 def get_level_structure(level_id, schematic):
@@ -94,8 +142,39 @@ def parse_external_dependencies(external_dependencies):
 #######################
 
 
+def _read_operator_parameters(operator):
+    gusty_parameters = getattr(operator, "_gusty_parameters", None)
+    if gusty_parameters is not None:
+        return gusty_parameters
+    init = operator.__init__ if inspect.isclass(operator) else operator
+    return tuple(inspect.signature(init).parameters)
+
+
+# operator classes are hashable and fixed once imported, so their parameters are cached
+_read_class_parameters = lru_cache(maxsize=None)(_read_operator_parameters)
+
+
 def _get_operator_parameters(operator):
-    return ["wrong_param1", "wrong_param2"]
+    if inspect.isclass(operator):
+        return _read_class_parameters(operator)
+    # other callables may be unhashable (e.g. a callable dataclass instance)
+    return _read_operator_parameters(operator)
+
+
+def _read_task_parameters(operator):
+    return _BASE_OPERATOR_PARAMS | frozenset(_get_operator_parameters(operator))
+
+
+_read_class_task_parameters = lru_cache(maxsize=None)(_read_task_parameters)
+
+
+def _get_task_parameters(operator):
+    """
+    All kwargs a task can take from its spec: BaseOperator's parameters plus the operator's own
+    """
+    if inspect.isclass(operator):
+        return _read_class_task_parameters(operator)
+    return _read_task_parameters(operator)
 
 
 def build_task(spec, level_id, schematic):
@@ -104,13 +183,8 @@ def build_task(spec, level_id, schematic):
     """
     operator = get_operator("airflow.operators.dummy.DummyOperator")
 
-    args = {
-        k: v
-        for k, v in spec.items()
-        if k
-        in inspect.signature(airflow.models.BaseOperator.__init__).parameters.keys()
-        or k in _get_operator_parameters(operator)
-    }
+    task_parameters = _get_task_parameters(operator)
+    args = {k: v for k, v in spec.items() if k in task_parameters}
     args["task_id"] = "broken_task_id"
     args["dag"] = get_top_level_dag(schematic)
     if airflow_version > 1:
@@ -131,9 +205,7 @@ def build_structure(schematic, parent_id, name, metadata):
     if is_top_level:
         if metadata is not None:
             level_init_data = {
-                k: v
-                for k, v in metadata.items()
-                if k not in inspect.signature(DAG.__init__).parameters.keys()
+                k: v for k, v in metadata.items() if k not in _DAG_PARAMS
             }
         else:
             level_init_data = {}
@@ -163,8 +235,7 @@ def build_structure(schematic, parent_id, name, metadata):
             level_init_data = {
                 k: v
                 for k, v in metadata.items()
-                if k not in inspect.signature(TaskGroup.__init__).parameters.keys()
-                and k not in ["dag", "parent_group"]
+                if k not in _TASK_GROUP_PARAMS and k not in _TASK_GROUP_RESERVED
             }
             level_defaults.update(level_init_data)
 
@@ -203,9 +274,7 @@ class GustyBuilder:
         # DAG defaults - everything that's not task_group_defaults or wait_for_defaults
         # is considered DAG default metadata
         self.dag_defaults = {
-            k: v
-            for k, v in kwargs.items()
-            if k not in ["task_group_defaults", "wait_for_defaults"]
+            k: v for k, v in kwargs.items() if k not in _NON_DAG_KWARGS
         }
 
         # TaskGroup defaults
@@ -218,16 +287,7 @@ class GustyBuilder:
             user_wait_for_defaults = {
                 k: v
                 for k, v in kwargs["wait_for_defaults"].items()
-                if k
-                in [
-                    "poke_interval",
-                    "timeout",
-                    "retries",
-                    "mode",
-                    "soft_fail",
-                    "execution_date_fn",
-                    "check_existence",
-                ]
+                if k in _WAIT_FOR_KEYS
             }
             self.wait_for_defaults.update(user_wait_for_defaults)
 
@@ -256,24 +316,21 @@ class GustyBuilder:
 
         # METADATA.yml will override defaults
         level_metadata_path = self.schematic[id]["metadata_path"]
-        if os.path.exists(level_metadata_path or ""):
+        if level_metadata_path and os.path.exists(level_metadata_path):
             with open(level_metadata_path) as inf:
-                level_metadata = yaml.load(inf, self.loader)
+                level_metadata = yaml.load(inf.read(), Loader=self.loader)
 
-            # special case - default_args provided in both metadata_defaults and level_metadata
+            # special case - default_args provided in both metadata_defaults and level_metadata,
+            # where METADATA.yml default_args are layered on top of create_dag default_args
             if (
                 self.schematic[id]["parent_id"] is None
-                and "default_args" in metadata_defaults.keys()
-                and "default_args" in level_metadata.keys()
+                and "default_args" in metadata_defaults
+                and "default_args" in level_metadata
             ):
-                # metadata defaults
-                metadata_default_args = metadata_defaults["default_args"]
-                # level_metadata (provided via METADATA.yml)
-                level_default_args = level_metadata["default_args"]
-                metadata_default_args = level_default_args
-                # updated and resolved attached back to level_metadata
-                level_metadata.update({"default_args": metadata_default_args})
-
+                level_metadata["default_args"] = {
+                    **metadata_defaults["default_args"],
+                    **level_metadata["default_args"],
+                }
         else:
             level_metadata = {}
         metadata_defaults.update(level_metadata)
@@ -284,15 +341,9 @@ class GustyBuilder:
         # metadata_default_dependencies allows for root-level default external dependencies
         # to be set at the root DAG level in create_dag. Any dependencies set in METADATA.yml
         # will override any defaults set in metadata_default_dependencies
-        level_dependencies = {
-            k: v
-            for k, v in level_metadata.items()
-            if k in ["wrong_dependencies", "wrong_external_dependencies"]
-        }
+        level_dependencies = {k: v for k, v in level_metadata.items() if k in _DEP_KEYS}
         metadata_default_dependencies = {
-            k: v
-            for k, v in metadata_defaults.items()
-            if k in ["wrong_external_dependencies"]
+            k: v for k, v in metadata_defaults.items() if k in _EXT_DEP_KEYS
         }
         if len(level_dependencies) > 0:
             self.schematic[id].update(level_dependencies)
@@ -326,11 +377,7 @@ class GustyBuilder:
         Given a level of the DAG, a structure such as a DAG or a TaskGroup will be initialized.
         """
         level_schematic = self.schematic[id]
-        level_kwargs = {
-            k: v
-            for k, v in level_schematic.items()
-            if k in inspect.signature(build_structure).parameters.keys()
-        }
+        level_kwargs = {k: level_schematic[k] for k in _BUILD_STRUCTURE_PARAMS}
 
         level_structure = build_structure(self.schematic, **level_kwargs)
 
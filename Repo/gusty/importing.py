@@ -1,4 +1,4 @@
-import os, sys, pkgutil, itertools, airflow, importlib
+import os, sys, airflow, importlib, functools
 from inflection import underscore
 
 ############
@@ -33,7 +33,7 @@ def get_operator_module(operator_string):
     return "nonexistent.module"
 
 
-# Add $AIRFLOW_HOME/operators directory to path for local.operator syntax to work
+# Local operators live in $GUSTY_HOME/operators, or $AIRFLOW_HOME/operators if GUSTY_HOME is unset
 
 gusty_home = os.environ.get("GUSTY_HOME", "")
 if gusty_home == "":
@@ -41,17 +41,29 @@ if gusty_home == "":
 else:
     CUSTOM_OPERATORS_DIR = os.path.join(gusty_home, "operators")
 
-sys.path.append(CUSTOM_OPERATORS_DIR)
-module_paths = [("", [CUSTOM_OPERATORS_DIR])]
-pairs = [
-    [(_.name, m + _.name) for _ in pkgutil.iter_modules(path)]
-    for m, path in module_paths
-]
-module_dict = dict(itertools.chain(*pairs))
+
+@functools.lru_cache(maxsize=None)
+def _add_custom_operators_dir_to_path():
+    """
+    Adds CUSTOM_OPERATORS_DIR to sys.path for local.operator syntax to work. This is done once, on
+    first use rather than at import, and skipped entirely when the directory does not exist.
+    """
+    # the module may be reloaded, so avoid growing sys.path on each load
+    if os.path.isdir(CUSTOM_OPERATORS_DIR) and CUSTOM_OPERATORS_DIR not in sys.path:
+        sys.path.append(CUSTOM_OPERATORS_DIR)
 
 
 def get_operator(operator_string):
     """
     Given an operator string, determine the location of that operator and return the operator object
     """
+    return _get_operator_cached(operator_string)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_operator_cached(operator_string):
+    """
+    Resolves an operator string once per process, as many tasks tend to share the same operator
+    """
+    _add_custom_operators_dir_to_path()
     raise ImportError(f"Cannot find operator: {operator_string}")
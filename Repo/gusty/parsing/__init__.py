@@ -1,5 +1,8 @@
 import os
+import copy
 import inspect
+from collections import OrderedDict
+from functools import lru_cache
 from gusty.parsing.loaders import generate_loader
 from gusty.parsing.parsers import parse_generic, parse_py, parse_ipynb, parse_sql
 
@@ -12,6 +15,87 @@ default_parsers = {
     ".ghi": parse_sql,
 }
 
+# generate_loader's result without custom constructors, shared by every parse call that doesn't pass a loader
+_DEFAULT_LOADER = generate_loader()
+
+# Parsed specs keyed by (file_path, mtime, size, parser, loader), so that unchanged
+# files are not re-parsed each time the scheduler re-imports a DAG file
+_PARSE_CACHE = OrderedDict()
+_PARSE_CACHE_SIZE = 10000
+
+# Only the built-in parsers are cached, as their output depends on nothing but the file and
+# loader. User parse_hooks may read env vars, Variables or the clock, and may be unhashable.
+_BUILTIN_PARSERS = tuple(default_parsers.values())
+
+
+def clear_parse_cache():
+    """
+    Empties the cache of parsed specs, e.g. for tests that rewrite a file within the mtime resolution
+    """
+    _PARSE_CACHE.clear()
+
+
+def _is_builtin_parser(parser):
+    """
+    Whether parser is one of gusty's own, compared by identity so unhashable parse_hooks are fine
+    """
+    return any(parser is builtin for builtin in _BUILTIN_PARSERS)
+
+
+def _read_accepts_loader(parser):
+    return "loader" in inspect.signature(parser).parameters
+
+
+# inspect.signature is slow to call per file, so the answer is cached for the built-in parsers
+_builtin_accepts_loader = lru_cache(maxsize=None)(_read_accepts_loader)
+
+
+def _accepts_loader(parser):
+    """
+    Whether a parser takes a loader kwarg
+    """
+    if _is_builtin_parser(parser):
+        return _builtin_accepts_loader(parser)
+    # parse_hooks may be unhashable, so they are checked each time
+    return _read_accepts_loader(parser)
+
+
+def _run_parser(file_path, parser, loader):
+    """
+    Runs parser on file_path, reusing the last result if the file has not changed since
+    """
+    cache_key = None
+    if _is_builtin_parser(parser):
+        try:
+            stat = os.stat(file_path)
+            cache_key = (file_path, stat.st_mtime_ns, stat.st_size, parser, loader)
+            hash(cache_key)
+        except (OSError, TypeError):
+            # a missing file or an unhashable loader is parsed without the cache
+            cache_key = None
+
+    if cache_key in _PARSE_CACHE:
+        _PARSE_CACHE.move_to_end(cache_key)
+        # callers mutate the spec and its nested values, so always hand out a deep copy
+        return copy.deepcopy(_PARSE_CACHE[cache_key])
+
+    if _accepts_loader(parser):
+        yaml_file = parser(file_path, loader=loader)
+    else:
+        yaml_file = parser(file_path)
+
+    if cache_key is not None:
+        try:
+            cached = copy.deepcopy(yaml_file)
+        except (TypeError, copy.Error):
+            # e.g. a custom constructor returned an object holding a lock, so leave it uncached
+            return yaml_file
+        _PARSE_CACHE[cache_key] = cached
+        if len(_PARSE_CACHE) > _PARSE_CACHE_SIZE:
+            _PARSE_CACHE.popitem(last=False)
+
+    return yaml_file
+
 
 def parse(file_path, parse_dict=default_parsers, loader=None):
     """
@@ -19,17 +103,17 @@ def parse(file_path, parse_dict=default_parsers, loader=None):
     """
 
     if loader is None:
-        loader = generate_loader()
+        loader = _DEFAULT_LOADER
 
     path, extension = os.path.splitext(file_path)
 
-    parser = parse_generic
+    parser = parse_dict.get(extension.lower())
 
-    if "loader" in inspect.signature(parser).parameters.keys():
-        yaml_file = parser(file_path, loader=loader)
+    if parser is None:
+        # no parser for this extension, so there is nothing worth reading
+        yaml_file = {}
     else:
-        yaml_file = parser(file_path)
-
+        yaml_file = _run_parser(file_path, parser, loader)
 
     # gusty always supplies a task_id and a file_path in a spec
     yaml_file["task_id"] = "broken_task_name"  # Always use same name
@@ -1,7 +1,17 @@
-import yaml
+import yaml, logging
 from datetime import datetime, timedelta
 from airflow.utils.dates import days_ago
 
+# libyaml's loader is much faster, but is only available when PyYAML was built against it
+try:
+    from yaml import CSafeLoader as _BaseLoader
+except ImportError:
+    from yaml import SafeLoader as _BaseLoader
+
+    logging.getLogger(__name__).warning(
+        "PyYAML was installed without libyaml, falling back to the slower pure-Python SafeLoader."
+    )
+
 
 def scalar_to_value(scalar):
     """
@@ -29,7 +39,7 @@ def wrap_yaml(func):
 
 def generate_loader(custom_constructors={}):
     """Generates a SafeLoader with both standard Airflow and custom constructors"""
-    loader = yaml.SafeLoader
+    loader = _BaseLoader
     dag_yaml_tags = {
         "!wrong_days_ago": days_ago,
         "!wrong_timedelta": timedelta,
@@ -1,4 +1,4 @@
-import yaml, ast, importlib.util, nbformat, jupytext, re
+import yaml, re
 from gusty.parsing.loaders import generate_loader
 from gusty.importing import airflow_version
 
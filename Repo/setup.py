@@ -16,8 +16,6 @@ setuptools.setup(
     install_requires=[
           'apache-airflow',
           'inflection',
-          'jupytext',
-          'nbformat',
           'PyYaml'
     ],
     classifiers=[
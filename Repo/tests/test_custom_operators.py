@@ -1,3 +1,4 @@
+from dataclasses import dataclass
 from airflow.models.baseoperator import BaseOperator
 from gusty.building import _get_operator_parameters
 
@@ -26,3 +27,19 @@ def test_get_operator_parameters_attribute():
 
     assert "a" in params
     assert list(params) == ["a"]
+
+
+def test_get_operator_parameters_unhashable():
+    @dataclass
+    class OperatorFactory:
+        default_a: int = 1
+
+        def __call__(self, a, **kwargs):
+            return BaseOperator(**kwargs)
+
+    factory = OperatorFactory()
+    factory._gusty_parameters = ("a",)
+
+    params = _get_operator_parameters(factory)
+
+    assert list(params) == ["a"]
@@ -1,9 +1,13 @@
+import os
 import pytest
+import threading
+from dataclasses import dataclass
 from airflow import DAG
 from datetime import datetime, timedelta
 from airflow.utils.dates import days_ago
 from gusty import create_dag
-from gusty.parsing import parse
+import gusty.parsing
+from gusty.parsing import parse, clear_parse_cache, _run_parser
 
 ##############
 ## FIXTURES ##
@@ -75,3 +79,113 @@ def test_parse_hooks(custom_task):
 
 def test_sql_parse(sql_task):
     assert sql_task.sql == "SELECT *\nFROM gusty_table"
+
+
+@pytest.fixture
+def counting_parser(monkeypatch):
+    calls = []
+
+    def parser(file_path):
+        calls.append(file_path)
+        return {"dependencies": ["a"]}
+
+    parser.calls = calls
+    # only built-in parsers are cached, so treat this one as built-in
+    monkeypatch.setattr(
+        gusty.parsing, "_BUILTIN_PARSERS", gusty.parsing._BUILTIN_PARSERS + (parser,)
+    )
+    clear_parse_cache()
+    yield parser
+    clear_parse_cache()
+
+
+@pytest.fixture
+def cached_spec_path(tmp_path):
+    spec_path = tmp_path / "cached_task.yml"
+    spec_path.write_text("operator: airflow.operators.bash.BashOperator\n")
+    return str(spec_path)
+
+
+def test_parse_cache_hit(counting_parser, cached_spec_path):
+    parse(cached_spec_path, parse_dict={".yml": counting_parser})
+    parse(cached_spec_path, parse_dict={".yml": counting_parser})
+    assert len(counting_parser.calls) == 1
+
+
+def test_parse_cache_mtime_change(counting_parser, cached_spec_path):
+    parse(cached_spec_path, parse_dict={".yml": counting_parser})
+    stat = os.stat(cached_spec_path)
+    os.utime(cached_spec_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    parse(cached_spec_path, parse_dict={".yml": counting_parser})
+    assert len(counting_parser.calls) == 2
+
+
+def test_parse_cache_size_change(counting_parser, cached_spec_path):
+    parse(cached_spec_path, parse_dict={".yml": counting_parser})
+    stat = os.stat(cached_spec_path)
+    with open(cached_spec_path, "a") as f:
+        f.write("bash_command: echo hello\n")
+    # restore the mtime, so only the size differs
+    os.utime(cached_spec_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    parse(cached_spec_path, parse_dict={".yml": counting_parser})
+    assert len(counting_parser.calls) == 2
+
+
+def test_clear_parse_cache(counting_parser, cached_spec_path):
+    parse(cached_spec_path, parse_dict={".yml": counting_parser})
+    clear_parse_cache()
+    parse(cached_spec_path, parse_dict={".yml": counting_parser})
+    assert len(counting_parser.calls) == 2
+
+
+def test_parse_hooks_are_not_cached(cached_spec_path):
+    calls = []
+
+    def parse_hook(file_path):
+        calls.append(file_path)
+        return {}
+
+    parse(cached_spec_path, parse_dict={".yml": parse_hook})
+    parse(cached_spec_path, parse_dict={".yml": parse_hook})
+    assert len(calls) == 2
+
+
+def test_unhashable_parse_hook(cached_spec_path):
+    @dataclass
+    class ParseHook:
+        spec: dict
+
+        def __call__(self, file_path):
+            return dict(self.spec)
+
+    spec = _run_parser(cached_spec_path, ParseHook({"a": 1}), None)
+    assert spec == {"a": 1}
+
+
+def test_parse_cache_returns_deep_copies(counting_parser, cached_spec_path):
+    first = _run_parser(cached_spec_path, counting_parser, None)
+    first["dependencies"].append("mutated")
+    second = _run_parser(cached_spec_path, counting_parser, None)
+    second["dependencies"].append("mutated")
+    third = _run_parser(cached_spec_path, counting_parser, None)
+    assert len(counting_parser.calls) == 1
+    assert third["dependencies"] == ["a"]
+
+
+def test_parse_cache_skips_uncopyable_specs(monkeypatch, cached_spec_path):
+    lock = threading.Lock()
+    calls = []
+
+    def parser(file_path):
+        calls.append(file_path)
+        return {"lock": lock}
+
+    monkeypatch.setattr(
+        gusty.parsing, "_BUILTIN_PARSERS", gusty.parsing._BUILTIN_PARSERS + (parser,)
+    )
+    clear_parse_cache()
+    first = _run_parser(cached_spec_path, parser, None)
+    second = _run_parser(cached_spec_path, parser, None)
+    clear_parse_cache()
+    assert len(calls) == 2
+    assert first["lock"] is lock and second["lock"] is lock